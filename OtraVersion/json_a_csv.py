@@ -1,13 +1,14 @@
-import json
-import pandas as pd
+import sys
+from pathlib import Path
 
-ENTRADA_JSON = "datos.json"
-SALIDA_CSV = "salida.csv"
+# solution.py está en la carpeta padre: la agregamos al path para reutilizar json_to_csv()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-with open(ENTRADA_JSON, "r", encoding="utf-8") as f:
-    data = json.load(f)
+from solution import json_to_csv
 
-df = pd.DataFrame(data)
-df.to_csv(SALIDA_CSV, index=False)
+ENTRADA_JSON = "datos.json"
+SALIDA_CSV = "salida.csv"
 
-print("CSV generado:", SALIDA_CSV)
+# index=False: igual que el df.to_csv(SALIDA_CSV, index=False) original
+# json_to_csv() ya muestra el mensaje de éxito con la ruta del CSV
+json_to_csv(ENTRADA_JSON, SALIDA_CSV, index=False)
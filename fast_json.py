@@ -0,0 +1,63 @@
+# fast_json.py
+# Lectura de JSON con la librería más rápida que esté instalada
+#
+# Orden de preferencia: orjson -> simdjson -> rapidjson -> ujson -> json
+# Todas tienen una función loads() compatible, así que main.py y solution.py
+# sólo usan loads() y JSONDecodeError de este módulo sin importar cuál se cargó.
+
+import importlib
+import json
+
+# Todos los errores de sintaxis se informan con la excepción de la librería estándar
+JSONDecodeError = json.JSONDecodeError
+
+# Buscamos la primera librería disponible; si no hay ninguna usamos json
+for BACKEND in ('orjson', 'simdjson', 'rapidjson', 'ujson'):
+    try:
+        _backend = importlib.import_module(BACKEND)
+        break
+    except ImportError:
+        continue
+else:
+    BACKEND = 'json'
+    _backend = json
+
+# Excepción que usa cada librería para los errores de sintaxis
+# (simdjson no tiene una propia y lanza ValueError)
+_BACKEND_ERROR = getattr(_backend, 'JSONDecodeError', ValueError)
+
+
+class _BackendDecodeError(JSONDecodeError):
+    """
+    JSONDecodeError con el mensaje de la librería, que no informa la posición del error
+    """
+
+    def __init__(self, msg):
+        ValueError.__init__(self, msg)
+        self.msg = msg
+        self.doc = self.pos = self.lineno = self.colno = None
+
+    def __reduce__(self):
+        return self.__class__, (self.msg,)
+
+
+def loads(data):
+    """
+    Convierte un documento JSON en objetos de Python
+
+    Args:
+        data (bytes | str): Contenido del JSON
+
+    Returns:
+        dict | list: Contenido del JSON como objetos de Python
+
+    Raises:
+        JSONDecodeError: Si el contenido no es JSON válido
+    """
+    try:
+        return _backend.loads(data)
+    except (JSONDecodeError, UnicodeDecodeError):
+        raise
+    except _BACKEND_ERROR as e:
+        # simdjson, rapidjson y ujson usan sus propias excepciones (derivadas de ValueError)
+        raise _BackendDecodeError(str(e)) from e
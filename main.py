@@ -3,10 +3,22 @@
 # Integrantes: Camila Guerra - Gastón D'Avola
 
 import pandas as pd
-import json
 import os
+import sys
+from pathlib import Path
+
+# records_dataframe() de solution.py arma el DataFrame por columnas (Arrow si pyarrow
+# está instalado) y write_csv() elige entre pyarrow y to_csv() según los tipos de columna
+from solution import records_dataframe, write_csv
+
+# fast_json usa la librería de JSON más rápida que esté instalada (orjson, simdjson,
+# rapidjson o ujson) y si no hay ninguna usa json como respaldo.
+from fast_json import loads, JSONDecodeError
 
 # --- Definición de Rutas ---
+# Carpeta donde está este script, calculada una sola vez al iniciar
+_HERE = Path(__file__).resolve().parent
+
 # Establecemos una variable con el nombre de la carpeta donde se encuentran los datasets
 # con el fin de crear una ruta
 datasets_folder = 'dataset'
@@ -15,11 +27,24 @@ datasets_folder = 'dataset'
 json_input_filename = 'pokemonDB_dataset.json'
 csv_output_filename = 'Datos_en_CSV.csv'
 
+# Si se define la variable de entorno VERBOSE (por ejemplo VERBOSE=1) mostramos
+# la vista previa del DataFrame; formatearla tiene su costo en tablas anchas
+verbose = bool(os.environ.get('VERBOSE'))
+
 # Construir las rutas completas para los archivos
-# Usamos os.path.join() para crear las rutas para ir a buscar el archivo JSON y 
+# Partimos de _HERE para crear las rutas para ir a buscar el archivo JSON y 
 # para guardar el archivo CSV
-json_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), datasets_folder, json_input_filename)
-csv_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), datasets_folder, csv_output_filename)
+json_file_path = str(_HERE / datasets_folder / json_input_filename)
+csv_file_path = str(_HERE / datasets_folder / csv_output_filename)
+
+# --- Mensajes para el usuario ---
+# En lugar de hacer un print() por cada línea (una escritura a la consola cada vez)
+# guardamos los mensajes y los mostramos todos juntos al final con una sola escritura
+mensajes = []
+
+def mostrar(texto):
+    # Guarda un mensaje para mostrarlo al final junto con los demás
+    mensajes.append(str(texto))
 
 # --- Lógica de lectura y escritura de archivos ---
 # Dentro del bloque try iniciamos la apertura del archivo JSON y la lectura
@@ -29,55 +54,68 @@ csv_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), dataset
 try:
 
     # Inicialización del programa
-    print("=" * 100)
-    print("Convertidor de JSON a CSV usando Pandas")
-    print("=" * 100)
-    print("\n")
+    mostrar("=" * 100)
+    mostrar("Convertidor de JSON a CSV usando Pandas")
+    mostrar("=" * 100)
+    mostrar("\n")
     # Leer el archivo JSON y cargarlo en un DataFrame de pandas de acuerdo a la consigna
     # Mostramos la ruta del archivo JSON que se está leyendo
-    print(f"Leyendo el archivo JSON desde: {json_file_path}")
-    print("\n")
+    mostrar(f"Leyendo el archivo JSON desde: {json_file_path}")
+    mostrar("\n")
     #Abro el archivo JSON y utilizo el método para abrirlo:
-    with open(json_file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
+    # Leemos el archivo entero como bytes con una sola lectura y se lo pasamos
+    # a loads() sin decodificarlo a str antes de parsearlo
+    data = loads(Path(json_file_path).read_bytes())
 
     # Con algunos de los datasets que nos descargamos tuvimos problemas para que los datos
     # queden en el formato correcto al pasarlo a CSV
     # Encontramos esta solución que depende el tipo de JSON que recibe 
     # Genera el dataFrame con métodos distintos
+    # records_dataframe() lo arma por columnas igual que json_to_csv() en solution.py;
+    # devuelve None si algún registro no es un diccionario y usamos los métodos de pandas
     if isinstance(data, dict):
-        df = pd.DataFrame.from_dict(data, orient='index')
+        df = records_dataframe(list(data.values()), index=list(data))
+        if df is None:
+            df = pd.DataFrame.from_dict(data, orient='index')
     elif isinstance(data, list):
-        df = pd.DataFrame(data)
+        df = records_dataframe(data)
+        if df is None:
+            df = pd.DataFrame(data)
     else:
-        print("Error: El formato del JSON no es compatible")
-        raise json.JSONDecodeError
+        # El mensaje de error lo muestra el except JSONDecodeError de más abajo
+        raise JSONDecodeError("El formato del JSON no es compatible", '', 0)
 
-    # Si el archivo es leido correctamente mostramos las primeras 5 filas utilizando print(df.head())
+    # Si el archivo es leido correctamente mostramos las primeras 5 filas utilizando df.head()
     # Como método de validación interno
-    print("=" * 100)
-    print("\nDatos leídos del JSON exitosamente. Mostrando las primeras 5 filas:")
-    print(df.head())
-    print("=" * 100)
-    print("\n")
+    if verbose:
+        mostrar("=" * 100)
+        mostrar("\nDatos leídos del JSON exitosamente. Mostrando las primeras 5 filas:")
+        mostrar(df.head())
+        mostrar("=" * 100)
+        mostrar("\n")
     
     # Escribimos el DataFrame en un CSV
     # Utilizamos la misma función del DataFrame to_csv() para generar el CSV
     # En la ruta que generamos anteriormente
-    print("=" * 100)
-    print(f"\nGuardando los datos en formato CSV en: {csv_file_path}")
-    df.to_csv(csv_file_path, index=True, encoding='utf-8')
-    print("=" * 100)
-    print("\n")
+    mostrar("=" * 100)
+    mostrar(f"\nGuardando los datos en formato CSV en: {csv_file_path}")
+    # write_csv() usa pyarrow si todas las columnas son texto o enteros y si no
+    # df.to_csv() con un buffer de 1 MiB; en ambos casos el índice es la primera columna
+    write_csv(df, csv_file_path)
+    mostrar("=" * 100)
+    mostrar("\n")
     # Finalmente hacemos una confirmación para el usuario si el CSV se generó exitosamente.
-    print("\n¡Proceso completado! El archivo CSV ha sido creado exitosamente.")
+    mostrar("\n¡Proceso completado! El archivo CSV ha sido creado exitosamente.")
 
 except FileNotFoundError:
     # Manejo de error de el archivo no encontrado
-    print(f"Error: No se encontró el archivo en la ruta especificada: {json_file_path}")
-    print(f"Por favor, asegúrate de que la carpeta '{datasets_folder}' exista y contenga el archivo {json_input_filename}.")
-except json.JSONDecodeError:
-    print(f"Error: El formato del JSON no es compatible")
+    mostrar(f"Error: No se encontró el archivo en la ruta especificada: {json_file_path}")
+    mostrar(f"Por favor, asegúrate de que la carpeta '{datasets_folder}' exista y contenga el archivo {json_input_filename}.")
+except JSONDecodeError:
+    mostrar(f"Error: El formato del JSON no es compatible")
 except Exception as e:
     # Manejo de errores genéricos
-    print(f"Ocurrió un error inesperado: {e}")
\ No newline at end of file
+    mostrar(f"Ocurrió un error inesperado: {e}")
+finally:
+    # Mostramos todos los mensajes acumulados con una única escritura
+    sys.stdout.write('\n'.join(mensajes) + '\n')
\ No newline at end of file
@@ -10,12 +10,39 @@ DECISIÓN DE LIBRERÍAS:
   * Ventajas: Manejo eficiente de DataFrames, conversión nativa JSON/CSV
   * Alternativas consideradas: csv (nativo), numpy (menos funcionalidades)
   * Justificación: Pandas ofrece métodos directos read_json() y to_csv()
+  * Se importa recién en las funciones que lo usan, así el camino sin
+    pandas (módulo csv) no carga pandas ni NumPy
 
 - json: Librería estándar de Python para manejo de JSON
   * Ventajas: Lectura segura con manejo de errores, control de encoding
   * Alternativas: pandas.read_json() directamente
   * Justificación: Mayor control sobre el proceso de lectura y validación
 
+- fast_json: Módulo del proyecto para leer JSON con la librería más rápida
+  * Ventajas: Usa orjson, simdjson, rapidjson o ujson si están instalados
+  * Uso: loads() y JSONDecodeError, sin importar qué librería se cargó
+  * Justificación: La lectura del JSON es la parte más costosa del proceso
+
+- pyarrow (opcional): Almacenamiento columnar para pandas
+  * Ventajas: Las columnas del DataFrame se guardan en memoria Arrow
+  * Uso: Si está instalado el DataFrame se construye por columnas
+    y las tablas de texto y enteros se escriben con pyarrow.csv.write_csv()
+    (en C++, por bloques; los textos quedan entre comillas)
+  * También se importa recién al usarlo (pyarrow carga NumPy)
+  * Justificación: Evita transponer fila por fila la lista de diccionarios
+    y el formateo fila por fila de to_csv()
+
+- csv: Librería estándar para escribir archivos CSV
+  * Ventajas: Escritor en C, sin el costo de armar un DataFrame
+  * Uso: Arrays de registros planos, u opción --no-pandas /
+    json_to_csv(..., use_pandas=False) para cualquier JSON
+  * Justificación: Para pasar registros JSON a CSV tal cual no hace falta pandas
+
+- concurrent.futures: Librería estándar para ejecución en paralelo
+  * Ventajas: Un proceso por archivo, sin que el GIL limite el trabajo
+  * Uso: convert_many() para convertir varios JSON a la vez
+  * Justificación: Leer y escribir cada archivo es independiente de los demás
+
 - os: Librería estándar para operaciones del sistema operativo
   * Ventajas: Manejo de rutas multiplataforma, verificación de archivos
   * Alternativas: pathlib (más moderno)
@@ -23,17 +50,268 @@ DECISIÓN DE LIBRERÍAS:
 
 - pathlib: Librería moderna para manejo de rutas
   * Ventajas: Sintaxis más limpia, orientada a objetos
-  * Uso: Solo para generar nombres de archivos automáticamente
+  * Uso: Ruta base del script y nombres de archivos automáticos
   * Justificación: Complementa os.path con funcionalidades adicionales
 """
 
-import pandas as pd  # Manipulación de datos estructurados y conversión JSON/CSV
 import os           # Operaciones del sistema operativo y manejo de rutas
-import json         # Lectura y validación de archivos JSON
-from pathlib import Path  # Generación automática de nombres de archivos
+import argparse     # Opciones de línea de comandos
+import codecs       # Normalización de nombres de codificación
+import csv          # Escritura directa de CSV sin pandas
+from concurrent.futures import ProcessPoolExecutor  # Conversión de varios archivos en paralelo
+from functools import partial  # Fijar opciones de json_to_csv() para los procesos
+from pathlib import Path  # Ruta del script y nombres de archivos automáticos
+
+from fast_json import loads, JSONDecodeError  # Parser JSON más rápido disponible
+
+# Carpeta donde está este script, calculada una sola vez al importar el módulo
+_HERE = Path(__file__).resolve().parent
+
+# Tamaño del buffer de escritura del CSV (1 MiB): menos llamadas write() al sistema
+CSV_BUFFER_SIZE = 1 << 20
+
+
+def _is_utf8(encoding):
+    """Indica si el nombre de codificación corresponde a UTF-8 ('utf-8', 'utf8', 'UTF_8'...)"""
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+def _pyarrow():
+    """
+    Importa pyarrow la primera vez que se necesita
+
+    Returns:
+        module | None: El módulo pyarrow (con pyarrow.csv), o None si no está instalado
+    """
+    try:
+        import pyarrow      # Almacenamiento columnar para pandas (pd.ArrowDtype)
+        import pyarrow.csv  # Escritura de CSV en C++
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def load_json(json_file_path, encoding='utf-8'):
+    """
+    Lee un archivo JSON con el parser más rápido disponible
+
+    El archivo se lee completo como bytes con una sola lectura y se entrega a
+    fast_json.loads(), que usa orjson, simdjson, rapidjson, ujson o json según
+    lo que esté instalado.
+
+    Args:
+        json_file_path (str): Ruta del archivo JSON de entrada
+        encoding (str): Codificación del archivo (default: 'utf-8')
+
+    Returns:
+        dict | list: Contenido del JSON como objetos de Python
+    """
+    # read_bytes() pide el archivo entero de una vez (el tamaño sale de fstat)
+    # y evita decodificarlo a str: los parsers rápidos trabajan sobre bytes
+    raw = Path(json_file_path).read_bytes()
+    if not _is_utf8(encoding):
+        return loads(raw.decode(encoding))
+    return loads(raw)
+
+
+def record_fieldnames(records):
+    """
+    Devuelve la unión de las claves de los registros en orden de aparición
+
+    Es el mismo orden de columnas que arma pandas con una lista de
+    diccionarios (en el dataset de Pokémon todos los registros tienen las
+    mismas claves).
+
+    Args:
+        records (list): Registros del JSON (un diccionario por fila)
+
+    Returns:
+        list: Nombres de los campos, uno por columna del CSV
+    """
+    return list(dict.fromkeys(key for record in records for key in record))
+
+
+def records_dataframe(records, index=None):
+    """
+    Construye el DataFrame columna por columna a partir de los registros
+
+    pd.DataFrame() sobre una lista de diccionarios (y from_dict() sobre un
+    diccionario de diccionarios) tiene que recorrer cada registro y
+    transponerlo a columnas. Acá se arma una lista por columna con
+    comprensiones de listas y, si pyarrow está instalado, se crea un único
+    buffer Arrow contiguo para cada una.
+
+    Args:
+        records (list): Registros del JSON (un diccionario por fila)
+        index (list, optional): Valores para el índice del DataFrame
+
+    Returns:
+        pandas.DataFrame | None: DataFrame construido por columnas, o None si
+                                 algún registro no es un diccionario
+    """
+    if not all(isinstance(record, dict) for record in records):
+        return None
+
+    import pandas as pd
+    pyarrow = _pyarrow()
+
+    names = record_fieldnames(records)
+    columns = {name: [record.get(name) for record in records] for name in names}
+
+    if pyarrow is not None:
+        try:
+            table = pyarrow.Table.from_pydict(columns)
+        except (pyarrow.ArrowException, OverflowError, TypeError):
+            # Columnas con tipos mezclados o enteros fuera de int64:
+            # dejamos que pandas las maneje como object
+            table = None
+        # Las listas y objetos anidados también quedan en pandas: como object se
+        # escriben igual que antes ("[1, 2]"), como columnas Arrow no ("[1 2]")
+        if table is not None and not any(pyarrow.types.is_nested(field.type)
+                                         for field in table.schema):
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            if index is not None:
+                df.index = index
+            return df
+
+    return pd.DataFrame(columns, index=index)
+
+
+def downcast_integers(df):
+    """
+    Reduce las columnas enteras al tipo más chico que las representa
+
+    Sólo se tocan columnas enteras: pasar float64 a float32 cambiaría los
+    valores escritos en el CSV, mientras que con enteros no se pierde nada.
+
+    Args:
+        df (pandas.DataFrame): DataFrame a ajustar (se modifica en el lugar)
+
+    Returns:
+        pandas.DataFrame: El mismo DataFrame con columnas enteras más chicas
+    """
+    import pandas as pd
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    return df
+
+
+def _arrow_csv_compatible(data_type):
+    """
+    Indica si pyarrow.csv escribe ese tipo de columna igual que to_csv()
+
+    Texto, enteros y nulos salen iguales (salvo que pyarrow pone los textos
+    entre comillas). Booleanos (true/false), decimales (2.0 -> 2), listas y
+    objetos anidados se escriben distinto o no se pueden escribir.
+    """
+    from pyarrow import types
+    return (types.is_string(data_type) or types.is_large_string(data_type)
+            or types.is_integer(data_type) or types.is_null(data_type))
+
+
+def write_csv(df, csv_file_path, encoding='utf-8', index=True):
+    """
+    Escribe el DataFrame en un CSV, por defecto incluyendo el índice
+
+    Con pyarrow instalado, si todas las columnas son texto o enteros, la
+    escritura se hace con pyarrow.csv.write_csv(), que formatea los datos en
+    C++ (los textos quedan entre comillas). En cualquier otro caso (otros
+    tipos, columnas con tipos mezclados, codificaciones distintas de UTF-8)
+    se usa DataFrame.to_csv().
+
+    Args:
+        df (pandas.DataFrame): Datos a exportar
+        csv_file_path (str): Ruta del archivo CSV de salida
+        encoding (str): Codificación del archivo (default: 'utf-8')
+        index (bool): Escribir el índice como primera columna (default: True)
+    """
+    pyarrow = _pyarrow() if _is_utf8(encoding) else None
+    if pyarrow is not None:
+        try:
+            # El índice pasa a ser la primera columna con encabezado vacío,
+            # igual que en la salida de to_csv(index=True)
+            table = pyarrow.Table.from_pandas(df.reset_index(names='') if index else df,
+                                              preserve_index=False)
+        except (pyarrow.ArrowException, OverflowError, TypeError, ValueError):
+            # Columnas object con tipos mezclados, enteros fuera de int64 o
+            # un campo con nombre vacío (choca con el encabezado del índice)
+            table = None
+        if table is not None and all(_arrow_csv_compatible(field.type) for field in table.schema):
+            try:
+                options = pyarrow.csv.WriteOptions(include_header=True, quoting_header='none',
+                                                   eol=os.linesep)
+                pyarrow.csv.write_csv(table, csv_file_path, write_options=options)
+                return
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError, TypeError):
+                # Por ejemplo, nombres de columna que necesitan comillas, o una
+                # versión de pyarrow sin quoting_header
+                pass
+
+    # pandas escribe por defecto con un buffer chico; le damos uno de 1 MiB
+    with open(csv_file_path, 'wb', buffering=CSV_BUFFER_SIZE) as file:
+        df.to_csv(file, index=index, encoding=encoding)
+
+
+def write_records_csv(data, csv_file_path, encoding='utf-8', fieldnames=None, index=True):
+    """
+    Escribe los registros del JSON en un CSV usando sólo el módulo csv
+
+    Genera la misma estructura que el camino con pandas: una primera columna
+    de índice con encabezado vacío (las claves del objeto JSON, o el número
+    de fila para arrays, salvo con index=False) seguida de una columna por
+    cada campo. Los valores
+    se escriben tal como los devuelve el parser, sin la conversión de tipos
+    de pandas (un entero con nulos queda 1 y no 1.0) ni las comillas de pyarrow.
+
+    Args:
+        data (dict | list): Contenido del JSON ya parseado
+        csv_file_path (str): Ruta del archivo CSV de salida
+        encoding (str): Codificación del archivo (default: 'utf-8')
+        fieldnames (list, optional): Campos ya calculados con record_fieldnames()
+        index (bool): Escribir la columna de índice (default: True)
+
+    Returns:
+        bool: True si se escribió el archivo, False si el formato del JSON
+              no es una colección de registros (diccionarios)
+    """
+    if isinstance(data, dict):
+        keys, records = list(data), list(data.values())
+    elif isinstance(data, list):
+        keys, records = range(len(data)), data
+    else:
+        return False
+    if not all(isinstance(record, dict) for record in records):
+        return False
+
+    if fieldnames is None:
+        fieldnames = record_fieldnames(records)
+    with open(csv_file_path, 'w', newline='', encoding=encoding,
+              buffering=CSV_BUFFER_SIZE) as file:
+        writer = csv.writer(file, lineterminator=os.linesep)
+        if index:
+            writer.writerow(['', *fieldnames])
+            writer.writerows([key, *(record.get(name) for name in fieldnames)]
+                             for key, record in zip(keys, records))
+        else:
+            writer.writerow(fieldnames)
+            writer.writerows([record.get(name) for name in fieldnames] for record in records)
+    return True
+
+
+def is_flat_record(record):
+    """
+    Indica si un registro es un diccionario sin objetos ni listas anidadas
+
+    Se usa sobre el primer registro como chequeo O(1) de que el JSON ya
+    tiene forma de tabla y puede escribirse sin pasar por pandas.
+    """
+    return isinstance(record, dict) and not any(
+        isinstance(value, (dict, list)) for value in record.values()
+    )
 
 
-def json_to_csv(json_file_path, csv_file_path=None, encoding='utf-8'):
+def json_to_csv(json_file_path, csv_file_path=None, encoding='utf-8', verbose=False,
+                use_pandas=True, index=True):
     """
     Convierte un archivo JSON a formato CSV usando Pandas DataFrame
     
@@ -50,6 +328,13 @@ def json_to_csv(json_file_path, csv_file_path=None, encoding='utf-8'):
         csv_file_path (str, optional): Ruta del archivo CSV de salida. 
                                       Si no se especifica, se genera automáticamente
         encoding (str): Codificación del archivo (default: 'utf-8')
+        verbose (bool): Mostrar información diagnóstica y una vista previa
+                        del DataFrame (default: False). Los errores se
+                        muestran siempre.
+        use_pandas (bool): Si es False se escribe el CSV directamente con el
+                           módulo csv, sin construir un DataFrame (default: True)
+        index (bool): Escribir el índice (claves del objeto JSON o número de
+                      fila) como primera columna del CSV (default: True)
     
     Returns:
         bool: True si la conversión fue exitosa, False en caso contrario
@@ -59,35 +344,59 @@ def json_to_csv(json_file_path, csv_file_path=None, encoding='utf-8'):
         # PASO 1: VALIDACIÓN DE ENTRADA
         # Verificar existencia del archivo antes de procesarlo
         # Esto evita errores costosos y proporciona feedback claro al usuario
-        if not os.path.exists(json_file_path):
+        # Un único os.stat() alcanza para saber si el archivo existe
+        try:
+            os.stat(json_file_path)
+        except FileNotFoundError:
             print(f"❌ Error: El archivo JSON no existe en la ruta: {json_file_path}")
             return False
         
-        print(f"📖 Leyendo archivo JSON desde: {json_file_path}")
+        if verbose:
+            print(f"📖 Leyendo archivo JSON desde: {json_file_path}")
         
-        # PASO 2: LECTURA SEGURA DEL JSON
-        # Usar context manager ('with') para garantizar cierre automático del archivo
-        # Especificar encoding explícitamente para evitar problemas con caracteres especiales
-        with open(json_file_path, 'r', encoding=encoding) as file:
-            data = json.load(file)  # json.load() es más eficiente que json.loads() para archivos
+        # PASO 2: LECTURA DEL JSON
+        # load_json() usa el parser más rápido instalado (ver fast_json.py)
+        data = load_json(json_file_path, encoding)
         
         # PASO 3: DETECCIÓN DE FORMATO Y CONVERSIÓN A DATAFRAME
         # El JSON puede tener dos formatos principales:
         # - Objeto/Diccionario: {clave1: {datos}, clave2: {datos}}
         # - Array/Lista: [{datos1}, {datos2}, {datos3}]
-        if isinstance(data, dict):
-            # Para objetos JSON: usar orient='index' para que las claves se conviertan en índice
+        # records_dataframe() arma el DataFrame por columnas (con pyarrow si está instalado)
+        fieldnames = None
+        if not use_pandas:
+            # Sin pandas los registros se escriben tal cual con el módulo csv (PASO 6)
+            df = None
+        elif isinstance(data, dict):
+            # Para objetos JSON: las claves se convierten en índice
             # Esto es ideal para datos como {pokemon1: {stats}, pokemon2: {stats}}
-            df = pd.DataFrame.from_dict(data, orient='index')
+            df = records_dataframe(list(data.values()), index=list(data))
+            if df is None:
+                import pandas as pd
+                df = pd.DataFrame.from_dict(data, orient='index')
+        elif isinstance(data, list) and data and is_flat_record(data[0]):
+            # Array de registros planos: ya es una tabla, así que se escribe
+            # directamente con el módulo csv (PASO 6) en una sola pasada
+            df = None
         elif isinstance(data, list):
-            # Para arrays JSON: conversión directa, cada elemento se convierte en una fila
+            # Para arrays JSON: cada elemento se convierte en una fila
             # Esto es ideal para datos como [{pokemon1}, {pokemon2}, {pokemon3}]
-            df = pd.DataFrame(data)
+            df = records_dataframe(data)
+            if df is None:
+                import pandas as pd
+                df = pd.DataFrame(data)
         else:
             # Manejar casos edge: JSON con tipos no soportados (números, strings, etc.)
-            print("❌ Error: El formato del JSON no es compatible")
+            print(f"❌ Error: El formato del JSON no es compatible: {json_file_path}")
             return False
         
+        if df is not None:
+            # Soltamos los diccionarios del JSON (uno por registro) antes de
+            # escribir el CSV. Con columnas Arrow los valores ya se copiaron y se
+            # libera todo; en columnas object el DataFrame sigue usando los
+            # mismos valores, así que sólo se liberan los diccionarios
+            del data
+        
         # PASO 4: GENERACIÓN AUTOMÁTICA DE NOMBRE DE ARCHIVO
         # Si no se especifica nombre de salida, generar uno automáticamente
         # Usar Path.stem para obtener nombre sin extensión del archivo original
@@ -98,48 +407,122 @@ def json_to_csv(json_file_path, csv_file_path=None, encoding='utf-8'):
         # PASO 5: INFORMACIÓN DIAGNÓSTICA DEL DATAFRAME
         # Mostrar estadísticas básicas para validar la conversión
         # Esto ayuda al usuario a verificar que los datos se procesaron correctamente
-        print(f"✅ Datos cargados exitosamente:")
-        print(f"   📊 Dimensiones: {df.shape[0]} filas × {df.shape[1]} columnas")
-        print(f"   📋 Columnas: {list(df.columns)}")
-        
-        # Mostrar muestra representativa de los datos
-        # df.head() muestra las primeras 5 filas por defecto
-        # to_string() asegura formato legible en consola
-        print("\n🔍 Primeras 5 filas del DataFrame:")
-        print(df.head().to_string())
+        # Sólo con verbose=True: formatear la vista previa tiene su costo en tablas anchas
+        if verbose and df is not None:
+            print(f"✅ Datos cargados exitosamente:")
+            print(f"   📊 Dimensiones: {df.shape[0]} filas × {df.shape[1]} columnas")
+            print(f"   📋 Columnas: {list(df.columns)}")
+            
+            # Mostrar muestra representativa de los datos
+            # df.head() muestra las primeras 5 filas por defecto
+            # to_string() asegura formato legible en consola
+            print("\n🔍 Primeras 5 filas del DataFrame:")
+            print(df.head().to_string())
+        elif verbose and isinstance(data, (dict, list)):
+            # Sin DataFrame (registros planos o use_pandas=False) contamos filas y
+            # campos sobre los registros; los campos se reutilizan al escribir el CSV
+            records = list(data.values()) if isinstance(data, dict) else data
+            if all(isinstance(record, dict) for record in records):
+                fieldnames = record_fieldnames(records)
+                print(f"✅ Datos cargados exitosamente:")
+                print(f"   📊 Dimensiones: {len(records)} filas × {len(fieldnames)} columnas")
+                print(f"   📋 Columnas: {fieldnames}")
         
         # PASO 6: EXPORTACIÓN A CSV
         # Configuración de parámetros:
-        # - index=True: Incluir índice del DataFrame (útil para datos con claves)
+        # - index=True: Incluir índice del DataFrame (útil para datos con claves);
+        #   se puede desactivar con json_to_csv(..., index=False)
         # - encoding='utf-8': Asegurar compatibilidad con caracteres especiales
-        print(f"\n💾 Guardando archivo CSV en: {csv_file_path}")
-        df.to_csv(csv_file_path, index=True, encoding=encoding)
+        # write_csv() usa pyarrow si está disponible y si no df.to_csv()
+        # Antes achicamos las columnas enteras para reducir la memoria al formatear
+        # Sin DataFrame (registros planos o use_pandas=False) se usa write_records_csv()
+        if verbose:
+            print(f"\n💾 Guardando archivo CSV en: {csv_file_path}")
+        if df is None:
+            if not write_records_csv(data, csv_file_path, encoding, fieldnames, index):
+                print(f"❌ Error: El formato del JSON no es compatible: {json_file_path}")
+                return False
+        else:
+            downcast_integers(df)
+            write_csv(df, csv_file_path, encoding, index)
         
         # PASO 7: VALIDACIÓN DE SALIDA
         # Verificar que el archivo se creó exitosamente y mostrar información
-        if os.path.exists(csv_file_path):
-            file_size = os.path.getsize(csv_file_path)
-            print(f"✅ ¡Conversión completada exitosamente!")
-            print(f"   📁 Archivo creado: {csv_file_path}")
-            print(f"   📏 Tamaño: {file_size:,} bytes")
-            return True
-        else:
-            print("❌ Error: No se pudo crear el archivo CSV")
+        # os.stat() confirma la existencia y devuelve el tamaño en una sola llamada
+        try:
+            file_size = os.stat(csv_file_path).st_size
+        except FileNotFoundError:
+            print(f"❌ Error: No se pudo crear el archivo CSV: {csv_file_path}")
             return False
+        # La ruta va siempre en el mensaje: con convert_many() se mezclan las
+        # salidas de varios archivos
+        print(f"✅ ¡Conversión completada exitosamente! 📁 {csv_file_path}")
+        if verbose:
+            print(f"   📏 Tamaño: {file_size:,} bytes")
+        return True
             
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         # MANEJO DE ERRORES ESPECÍFICOS: JSON malformado
-        # json.JSONDecodeError se activa cuando el archivo no es JSON válido
+        # JSONDecodeError (de fast_json) se activa cuando el archivo no es JSON válido
         # Esto puede ocurrir por: sintaxis incorrecta, caracteres especiales, etc.
-        print(f"❌ Error al decodificar JSON: {e}")
+        print(f"❌ Error al decodificar JSON ({json_file_path}): {e}")
         return False
     except Exception as e:
         # MANEJO DE ERRORES GENÉRICOS: Captura cualquier otro error inesperado
         # Esto incluye: errores de permisos, espacio en disco, problemas de memoria, etc.
-        print(f"❌ Error inesperado: {e}")
+        print(f"❌ Error inesperado ({json_file_path}): {e}")
         return False
 
 
+def convert_many(json_file_paths, max_workers=None, **options):
+    """
+    Convierte varios archivos JSON a CSV en paralelo, un proceso por archivo
+
+    Cada conversión es independiente (parseo del JSON y formateo del CSV),
+    así que usar procesos aprovecha todos los núcleos sin competir por el GIL.
+    Cada CSV se guarda junto a su JSON como <nombre>_converted.csv, así dos
+    archivos con el mismo nombre en carpetas distintas no se pisan. Si un
+    mismo CSV corresponde a más de un archivo sólo se convierte el primero.
+
+    Args:
+        json_file_paths (list): Rutas de los archivos JSON de entrada
+        max_workers (int, optional): Cantidad de procesos. Por defecto, los
+                                     núcleos disponibles para este proceso
+        **options: Parámetros extra para json_to_csv() (encoding, verbose,
+                   use_pandas)
+
+    Returns:
+        list: Resultado (True/False) de cada conversión, en el mismo orden
+    """
+    json_file_paths = list(json_file_paths)
+    if not json_file_paths:
+        return []
+
+    # CSV de salida junto a cada JSON; los repetidos no se vuelven a escribir
+    # (dos procesos escribiendo el mismo archivo lo dejarían corrupto)
+    jobs = {}
+    for json_file_path in json_file_paths:
+        path = Path(json_file_path)
+        csv_file_path = str(path.with_name(f"{path.stem}_converted.csv"))
+        if os.path.realpath(csv_file_path) in jobs:
+            print(f"❌ Error: {csv_file_path} ya se genera a partir de otro archivo, "
+                  f"no se convierte {json_file_path}")
+            continue
+        jobs[os.path.realpath(csv_file_path)] = (json_file_path, csv_file_path)
+    if max_workers is None:
+        # sched_getaffinity respeta los límites de CPU del contenedor (no existe en Windows/macOS)
+        try:
+            max_workers = len(os.sched_getaffinity(0))
+        except AttributeError:
+            max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(jobs))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        inputs, outputs = zip(*jobs.values())
+        done = dict(zip(inputs, executor.map(partial(json_to_csv, **options), inputs, outputs)))
+    return [done.pop(json_file_path, False) for json_file_path in json_file_paths]
+
+
 def main():
     """
     Función principal del programa
@@ -155,9 +538,29 @@ def main():
     - Separar datos en carpeta 'dataset' para organización
     - Generar rutas absolutas para evitar problemas de directorio de trabajo
     """
+    # OPCIONES DE LÍNEA DE COMANDOS
+    # --no-pandas: escribir el CSV con el módulo csv, sin construir un DataFrame
+    # json_files: archivos a convertir en paralelo (si no se indican, se usa el dataset)
+    parser = argparse.ArgumentParser(description="Convertidor de JSON a CSV")
+    parser.add_argument('json_files', nargs='*',
+                        help="archivos JSON a convertir en paralelo (por defecto, el dataset de Pokémon)")
+    parser.add_argument('--no-pandas', action='store_true',
+                        help="escribir el CSV directamente con el módulo csv, sin pandas")
+    args = parser.parse_args()
+    verbose = bool(os.environ.get('VERBOSE'))
+
     print("🚀 Convertidor de JSON a CSV usando Pandas")
     print("=" * 50)
     
+    # CONVERSIÓN DE VARIOS ARCHIVOS
+    # Si se pasaron archivos por línea de comandos se convierten todos en paralelo
+    # (cada CSV queda junto a su JSON)
+    if args.json_files:
+        results = convert_many(args.json_files, verbose=verbose,
+                               use_pandas=not args.no_pandas)
+        print(f"\n📦 Archivos convertidos: {sum(results)} de {len(results)}")
+        return
+    
     # CONFIGURACIÓN DE RUTAS Y ARCHIVOS
     # Definir nombres de archivos y carpetas de manera centralizada
     # Esto facilita el mantenimiento y modificación del programa
@@ -166,17 +569,16 @@ def main():
     csv_output_filename = 'pokemonDB_converted.csv' # Archivo CSV de salida
     
     # CONSTRUCCIÓN DE RUTAS ABSOLUTAS
-    # os.path.abspath(__file__) obtiene la ruta absoluta del script actual
-    # os.path.dirname() obtiene el directorio padre del script
+    # _HERE es el directorio del script, resuelto una vez al importar el módulo
     # Esto garantiza que las rutas funcionen independientemente del directorio de trabajo
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    json_file_path = os.path.join(current_dir, datasets_folder, json_input_filename)
-    csv_file_path = os.path.join(current_dir, datasets_folder, csv_output_filename)
+    dataset_dir = _HERE / datasets_folder
+    json_file_path = str(dataset_dir / json_input_filename)
+    csv_file_path = str(dataset_dir / csv_output_filename)
     
     # VALIDACIÓN Y CREACIÓN DE ESTRUCTURA DE CARPETAS
     # Verificar si la carpeta dataset existe, si no, crearla automáticamente
     # Esto mejora la experiencia del usuario evitando errores por carpetas faltantes
-    dataset_path = os.path.join(current_dir, datasets_folder)
+    dataset_path = str(dataset_dir)
     if not os.path.exists(dataset_path):
         print(f"❌ Error: La carpeta '{datasets_folder}' no existe")
         print(f"   Creando carpeta '{datasets_folder}'...")
@@ -187,7 +589,9 @@ def main():
     # EJECUCIÓN DE LA CONVERSIÓN
     # Llamar a la función principal con las rutas configuradas
     # El valor de retorno indica éxito o fallo del proceso
-    success = json_to_csv(json_file_path, csv_file_path)
+    # Con la variable de entorno VERBOSE definida se muestra la información diagnóstica
+    success = json_to_csv(json_file_path, csv_file_path, verbose=verbose,
+                          use_pandas=not args.no_pandas)
     
     # REPORTE FINAL DEL PROCESO
     # Mostrar resultado claro al usuario con información relevante
@@ -233,16 +637,18 @@ RESUMEN DE DECISIONES DE DISEÑO:
 5. EXPERIENCIA DE USUARIO:
    - Mensajes informativos durante el proceso
    - Estadísticas del DataFrame (dimensiones, columnas)
-   - Vista previa de los datos procesados
+   - Vista previa de los datos procesados (con verbose=True o VERBOSE=1)
    - Confirmación de archivos creados con tamaño
 
 6. OPTIMIZACIONES DE RENDIMIENTO:
    - Context manager para manejo automático de archivos
-   - Lectura eficiente con json.load() vs json.loads()
+   - Lectura eficiente con orjson, simdjson, rapidjson o ujson (si están instalados)
    - Configuración óptima de pandas para CSV (index=True, encoding)
+   - Escritura del CSV con pyarrow (C++) cuando está instalado y las columnas
+     son texto o enteros; el resto se escribe con pandas
 
 7. COMPATIBILIDAD:
    - Encoding UTF-8 para caracteres especiales
-   - Rutas multiplataforma con os.path.join()
+   - Rutas multiplataforma con pathlib (Path / 'carpeta' / 'archivo')
    - Manejo de diferentes tipos de JSON
 """